@@ -1,39 +1,283 @@
 #!/usr/bin/env python3
 """dev-mesh dashboard — always-on status page for the local service mesh."""
 
+import gzip
+import hashlib
 import json
 import os
 import signal
 import socket
 import sys
-import urllib.request
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
 
-CADDY_ADMIN = "http://localhost:2019"
+try:  # C-accelerated serializer when available; compact stdlib otherwise
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+CADDY_ADMIN_HOST = ("localhost", 2019)
 SOCK_DIR = "/tmp/caddy-dev"
 SOCK_PATH = os.path.join(SOCK_DIR, "dev-mesh.sock")
 ROUTE_ID = "dev-mesh"
 
+# Shared pool for fanning out Caddy admin calls; sized for the status fetches.
+_POOL = ThreadPoolExecutor(max_workers=5)
 
-def caddy_get(path):
+# Bound concurrent admin API access so a burst of handler threads can't
+# hammer Caddy's single-threaded admin endpoint.
+_CADDY_SEM = threading.Semaphore(4)
+
+# Serving is decoupled from fetching: a background thread refreshes this
+# snapshot on a fixed cadence and handlers only ever read the last good
+# blob, so /api/status is a pure socket write and admin load stays bounded
+# no matter how many clients are connected. The dict is swapped wholesale
+# (an atomic pointer assignment) so body and etag always match.
+_SNAPSHOT = {"body": b"", "etag": "", "stale": False}
+_SNAPSHOT_CHANGED = threading.Condition()
+_REFRESH_INTERVAL = 2.0
+
+
+def refresh_snapshot():
+    """Rebuild the status snapshot; wake SSE streams if it changed.
+
+    On a Caddy admin hiccup the previous body is kept and only marked
+    stale rather than erroring out on every client.
+    """
+    global _SNAPSHOT
     try:
-        with urllib.request.urlopen(f"{CADDY_ADMIN}{path}", timeout=2) as r:
-            return json.loads(r.read()) if r.status == 200 else None
+        body = _dumps(get_status())
+        stale = False
     except Exception:
-        return None
+        body, stale = _SNAPSHOT["body"], True
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    changed = etag != _SNAPSHOT["etag"]
+    _SNAPSHOT = {"body": body, "etag": etag, "stale": stale}
+    if changed:
+        with _SNAPSHOT_CHANGED:
+            _SNAPSHOT_CHANGED.notify_all()
+
+
+def _refresh_loop():
+    while True:
+        refresh_snapshot()
+        time.sleep(_REFRESH_INTERVAL)
+
+
+# Minimal HTTP/1.1 client specialized for the admin endpoint: the stdlib
+# clients re-do URL parsing, opener chains and header dicts on every call,
+# all of which is constant here. Keep-alive socket per worker thread; the
+# request bytes for the hot GET paths are precomputed once.
+_SOCK_LOCAL = threading.local()
+
+_REQUEST_TEMPLATE = (
+    "%s %s HTTP/1.1\r\n"
+    "Host: %s:%d\r\n"
+    "Connection: keep-alive\r\n" % ("%s", "%s", *CADDY_ADMIN_HOST)
+)
+
+_GET_BLOBS = {
+    path: (_REQUEST_TEMPLATE % ("GET", path) + "\r\n").encode("ascii")
+    for path in (
+        "/config/apps/http/servers/srv0/routes",
+        "/reverse_proxy/upstreams",
+        "/config/apps/tls/",
+        "/config/apps/dynamic_dns/",
+    )
+}
 
 
-def caddy_get_text(path):
+def _caddy_sock():
+    sock = getattr(_SOCK_LOCAL, "sock", None)
+    if sock is None:
+        sock = socket.create_connection(CADDY_ADMIN_HOST, timeout=2)
+        _SOCK_LOCAL.sock = sock
+        _SOCK_LOCAL.rfile = sock.makefile("rb")
+    return sock, _SOCK_LOCAL.rfile
+
+
+def _drop_sock():
+    sock = getattr(_SOCK_LOCAL, "sock", None)
+    if sock is not None:
+        _SOCK_LOCAL.sock = None
+        try:
+            _SOCK_LOCAL.rfile.close()
+            sock.close()
+        except OSError:
+            pass
+
+
+def _read_response(rfile):
+    """Parse one response off the keep-alive socket. Returns (status, body)."""
+    status_line = rfile.readline()
+    if not status_line:
+        raise ConnectionError("server closed keep-alive connection")
+    status = int(status_line.split(None, 2)[1])
+    length = None
+    chunked = False
+    while True:
+        line = rfile.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        name = name.strip().lower()
+        if name == b"content-length":
+            length = int(value)
+        elif name == b"transfer-encoding" and b"chunked" in value.lower():
+            chunked = True
+    if chunked:
+        body = bytearray()
+        while True:
+            size = int(rfile.readline().split(b";")[0], 16)
+            if size == 0:
+                rfile.readline()  # trailing CRLF after last chunk
+                break
+            body += rfile.read(size)
+            rfile.readline()  # CRLF after each chunk
+        return status, bytes(body)
+    if length is None:
+        # Unframed body: runs to EOF, so the socket can't be reused.
+        body = rfile.read()
+        _drop_sock()
+        return status, body
+    return status, rfile.read(length)
+
+
+def _caddy_request(method, path, body=None):
+    """One admin API exchange on this thread's socket, reconnecting once."""
+    blob = _GET_BLOBS.get(path) if body is None and method == "GET" else None
+    if blob is None:
+        req = _REQUEST_TEMPLATE % (method, path)
+        if body is not None:
+            req += ("Content-Type: application/json\r\n"
+                    "Content-Length: %d\r\n" % len(body))
+        blob = req.encode("ascii") + b"\r\n" + (body or b"")
+    for attempt in (0, 1):
+        sock, rfile = _caddy_sock()
+        try:
+            sock.sendall(blob)
+            return _read_response(rfile)
+        except (OSError, ValueError):
+            _drop_sock()  # stale or garbled socket; retry on a fresh one
+            if attempt:
+                raise
+
+
+def caddy_get_raw(path):
     try:
-        with urllib.request.urlopen(f"{CADDY_ADMIN}{path}", timeout=2) as r:
-            return r.read().decode() if r.status == 200 else None
+        with _CADDY_SEM:
+            status, body = _caddy_request("GET", path)
+        return body if status == 200 else None
     except Exception:
         return None
 
 
+def caddy_get(path):
+    body = caddy_get_raw(path)
+    if body is None:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def caddy_iter_lines(path):
+    """Yield response lines as bytes without buffering the whole body.
+
+    Uses a throwaway HTTP/1.0 connection so the reply can't be chunked
+    and the body simply runs to EOF — no framing to track while streaming.
+    """
+    req = ("GET %s HTTP/1.0\r\nHost: %s:%d\r\n\r\n"
+           % (path, *CADDY_ADMIN_HOST)).encode("ascii")
+    try:
+        with _CADDY_SEM, socket.create_connection(CADDY_ADMIN_HOST, timeout=2) as sock:
+            sock.sendall(req)
+            rfile = sock.makefile("rb")
+            status = int(rfile.readline().split(None, 2)[1])
+            while rfile.readline() not in (b"\r\n", b"\n", b""):
+                pass
+            if status != 200:
+                return
+            yield from rfile
+    except Exception:
+        return
+
+
+# Metrics we scan for, anchored at line start. bytes.startswith with a
+# tuple tests all prefixes in one C call, so adding a metric costs no
+# extra pass over the exposition.
+_METRIC_PREFIXES = (
+    b'caddy_reverse_proxy_upstreams_healthy{',
+    b'caddy_reverse_proxy_upstreams_fails_total{',
+)
+_METRIC_NAME_OFF = len(b"caddy_reverse_proxy_upstreams_")
+_UPSTREAM_LABEL = b'upstream="'
+
+
+def fetch_metrics_maps(routes_future):
+    """Stream /metrics and keep only lines for our own upstreams.
+
+    A busy Caddy's /metrics can run to megabytes; operating on the raw
+    bytes line-by-line skips both the full-body allocation and the UTF-8
+    decode for lines we throw away anyway. Caddy may also proxy routes
+    that aren't part of the mesh, so the scan only parses values for
+    addresses the mesh routes actually reference.
+
+    Returns (health_map, fails_map).
+    """
+    wanted = wanted_addrs(routes_future.result() or b"[]")
+    health_map = {}
+    fails_map = {}
+    healthy_byte = ord("h")
+    for line in caddy_iter_lines("/metrics"):
+        if not line.startswith(_METRIC_PREFIXES):
+            continue
+        try:
+            idx = line.index(_UPSTREAM_LABEL) + len(_UPSTREAM_LABEL)
+            addr = line[idx:line.index(b'"', idx)].decode()
+            if addr not in wanted:
+                continue
+            val = float(line[line.rindex(b" ") + 1:])
+        except ValueError:
+            continue
+        # The two metric names first differ right after the shared
+        # "caddy_reverse_proxy_upstreams_" prefix: 'h'ealthy vs 'f'ails.
+        if line[_METRIC_NAME_OFF] == healthy_byte:
+            health_map[addr] = val == 1
+        else:
+            fails_map[addr] = int(val)
+    return health_map, fails_map
+
+
+# TLS subjects are stable facts — cache the parsed config for a minute so
+# discover_domain and get_status share one fetch instead of re-reading it
+# on every status refresh.
+_TLS_CACHE = {"ts": 0.0, "val": None}
+_TLS_TTL = 60.0
+
+
+def fetch_tls():
+    if time.monotonic() - _TLS_CACHE["ts"] < _TLS_TTL:
+        return _TLS_CACHE["val"]
+    tls = caddy_get("/config/apps/tls/")
+    if tls is None:
+        # Failed refresh: keep serving the last good config rather than
+        # flashing an empty TLS section while Caddy reloads.
+        return _TLS_CACHE["val"]
+    _TLS_CACHE["val"] = tls
+    _TLS_CACHE["ts"] = time.monotonic()
+    return tls
+
+
 def discover_domain():
     """Read domain pattern from Caddy's TLS config."""
-    tls = caddy_get("/config/apps/tls/")
+    tls = fetch_tls()
     if tls:
         subjects = (tls.get("certificates", {}).get("automate") or
                      [p["subjects"][0] for p in tls.get("automation", {}).get("policies", []) if p.get("subjects")])
@@ -53,52 +297,40 @@ def register_with_caddy(domain):
         }]
     }).encode()
     # Remove existing route first (ignore errors)
-    try:
-        req = urllib.request.Request(f"{CADDY_ADMIN}/id/{ROUTE_ID}", method="DELETE")
-        urllib.request.urlopen(req, timeout=2)
-    except Exception:
-        pass
-    req = urllib.request.Request(
-        f"{CADDY_ADMIN}/config/apps/http/servers/srv0/routes",
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    urllib.request.urlopen(req, timeout=2)
+    deregister_from_caddy()
+    status, body = _caddy_request(
+        "POST", "/config/apps/http/servers/srv0/routes", body=data)
+    if status >= 300:
+        raise RuntimeError(f"route registration failed: {status} {body.decode(errors='replace')}")
 
 
 def deregister_from_caddy():
     try:
-        req = urllib.request.Request(f"{CADDY_ADMIN}/id/{ROUTE_ID}", method="DELETE")
-        urllib.request.urlopen(req, timeout=2)
+        _caddy_request("DELETE", f"/id/{ROUTE_ID}")
     except Exception:
         pass
 
 
-def get_status():
-    routes = caddy_get("/config/apps/http/servers/srv0/routes") or []
-    upstreams = caddy_get("/reverse_proxy/upstreams") or []
-    tls_config = caddy_get("/config/apps/tls/") or {}
-    dyn_dns = caddy_get("/config/apps/dynamic_dns/") or {}
-    metrics_text = caddy_get_text("/metrics") or ""
+# Parsed routes memoized on a digest of the raw JSON: routes change rarely,
+# so the per-request rebuild of hosts/socket lists is usually skipped.
+# Stored as one (digest, parsed) tuple and swapped wholesale — like
+# _SNAPSHOT — so concurrent callers never see a digest paired with
+# another payload's parse.
+_ROUTES_CACHE = (b"", [])
 
-    # Parse upstream health from prometheus metrics
-    health_map = {}
-    for line in metrics_text.splitlines():
-        if line.startswith("caddy_reverse_proxy_upstreams_healthy{"):
-            try:
-                addr = line.split('upstream="')[1].split('"')[0]
-                val = float(line.split()[-1])
-                health_map[addr] = val == 1
-            except (IndexError, ValueError):
-                pass
-
-    # Build upstream lookup by address
-    upstream_map = {}
-    for u in upstreams:
-        upstream_map[u["address"]] = u
 
-    services = []
+def parse_routes(raw):
+    """Extract the static per-route fields (id, hosts, socket paths)."""
+    global _ROUTES_CACHE
+    digest = hashlib.blake2b(raw, digest_size=8).digest()
+    cached_digest, cached = _ROUTES_CACHE
+    if digest == cached_digest:
+        return cached
+    parsed = []
+    try:
+        routes = json.loads(raw) or []
+    except ValueError:
+        routes = []
     for route in routes:
         route_id = route.get("@id", "unknown")
         hosts = []
@@ -108,11 +340,73 @@ def get_status():
         for h in route.get("handle", []):
             for u in h.get("upstreams", []):
                 sock = u.get("dial", "")
-
-        # Normalize socket path for lookups
+        # Normalize socket path for lookups; Caddy uses "unix//path" in
+        # upstream addresses.
         sock_file = sock.replace("unix/", "").replace("unix//", "/")
-        sock_addr = sock  # Caddy uses "unix//path" in upstream addresses
-        sock_exists = os.path.exists(sock_file)
+        parsed.append((route_id, hosts, sock_file, sock))
+    _ROUTES_CACHE = (digest, parsed)
+    return parsed
+
+
+def wanted_addrs(raw):
+    """Upstream addresses the mesh routes actually reference."""
+    return {sock_addr for _, _, _, sock_addr in parse_routes(raw)}
+
+
+# Last non-empty status, kept so a Caddy reload shows stale-but-real data
+# instead of an empty dashboard.
+_LAST_GOOD_STATUS = None
+
+
+def get_status():
+    global _LAST_GOOD_STATUS
+    # Fire all admin API calls concurrently; total latency is the slowest
+    # single round-trip instead of the sum of five.
+    routes_future = _POOL.submit(
+        caddy_get_raw, "/config/apps/http/servers/srv0/routes")
+    futures = [
+        _POOL.submit(caddy_get, "/reverse_proxy/upstreams"),
+        _POOL.submit(caddy_get, "/config/apps/dynamic_dns/"),
+        _POOL.submit(fetch_metrics_maps, routes_future),
+    ]
+    tls_config = fetch_tls() or {}
+    routes_raw = routes_future.result()
+    upstreams = futures[0].result()
+    dyn_dns = futures[1].result()
+    health_map, fails_map = futures[2].result()
+    # The fetch helpers swallow errors into None, so a None here means the
+    # admin API itself was unreachable — distinct from a legitimately
+    # empty routes list.
+    fetch_failed = routes_raw is None or upstreams is None or dyn_dns is None
+    routes_raw = routes_raw or b"[]"
+    routes = parse_routes(routes_raw)
+    wanted = wanted_addrs(routes_raw)
+    upstreams = upstreams or []
+    dyn_dns = dyn_dns or {}
+
+    # Only index upstreams the routes reference; Caddy may carry unrelated
+    # reverse_proxy entries we'd never look up.
+    upstream_map = {u["address"]: u for u in upstreams if u["address"] in wanted}
+
+    # One listdir instead of an os.path.exists syscall per route.
+    try:
+        sock_files = set(os.listdir(SOCK_DIR))
+    except OSError:
+        sock_files = set()
+
+    # Structure-of-arrays: field names appear once in the JSON instead of
+    # once per service, roughly halving payload size for a typical mesh.
+    services = {
+        "id": [],
+        "hosts": [],
+        "socket": [],
+        "socket_exists": [],
+        "healthy": [],
+        "requests": [],
+        "fails": [],
+    }
+    for route_id, hosts, sock_file, sock_addr in routes:
+        sock_exists = os.path.basename(sock_file) in sock_files
 
         upstream_info = upstream_map.get(sock_addr, {})
         healthy = health_map.get(sock_addr)
@@ -120,15 +414,14 @@ def get_status():
         if healthy is None:
             healthy = sock_exists
 
-        services.append({
-            "id": route_id,
-            "hosts": hosts,
-            "socket": sock_file,
-            "socket_exists": sock_exists,
-            "healthy": healthy,
-            "requests": upstream_info.get("num_requests", 0),
-            "fails": upstream_info.get("fails", 0),
-        })
+        services["id"].append(route_id)
+        services["hosts"].append(hosts)
+        services["socket"].append(sock_file)
+        services["socket_exists"].append(sock_exists)
+        services["healthy"].append(healthy)
+        services["requests"].append(upstream_info.get("num_requests", 0))
+        services["fails"].append(
+            upstream_info.get("fails", fails_map.get(sock_addr, 0)))
 
     # TLS info
     automate = tls_config.get("certificates", {}).get("automate", [])
@@ -139,7 +432,7 @@ def get_status():
     dns_domains = dyn_dns.get("domains", {})
     dns_versions = dyn_dns.get("versions", {})
 
-    return {
+    status = {
         "services": services,
         "tls_domains": tls_domains,
         "dns": {
@@ -149,6 +442,16 @@ def get_status():
         },
     }
 
+    # If any fetch failed (e.g. while Caddy reloads), serve the last
+    # known-good state, flagged stale, instead of "no services" — and
+    # never let the partial payload overwrite that snapshot.
+    if fetch_failed:
+        if _LAST_GOOD_STATUS is not None:
+            return {**_LAST_GOOD_STATUS, "stale": True}
+        return status
+    _LAST_GOOD_STATUS = status
+    return status
+
 
 DASHBOARD_HTML = """\
 <!DOCTYPE html>
@@ -196,42 +499,51 @@ DASHBOARD_HTML = """\
 <div class="infra" id="infra"></div>
 <div class="refresh" id="refresh"></div>
 <script>
-async function refresh() {
-  try {
-    const r = await fetch('/api/status');
-    const d = await r.json();
-    renderServices(d.services);
-    renderInfra(d);
-    document.getElementById('refresh').textContent = 'updated ' + new Date().toLocaleTimeString();
-  } catch(e) {
-    document.getElementById('refresh').textContent = 'error: ' + e.message;
+const stream = new EventSource('/api/stream');
+stream.onmessage = e => {
+  const d = JSON.parse(e.data);
+  renderServices(d.services);
+  renderInfra(d);
+  const sub = document.getElementById('subtitle');
+  if (d.stale) {
+    sub.textContent = 'showing last known state (admin unreachable)';
+    sub.style.color = '#eab308';
+  } else {
+    sub.style.color = '';
   }
-}
-
-function renderServices(services) {
+  document.getElementById('refresh').textContent = 'updated ' + new Date().toLocaleTimeString();
+};
+stream.onerror = () => {
+  document.getElementById('refresh').textContent = 'reconnecting...';
+};
+
+function renderServices(s) {
+  // Payload is structure-of-arrays: parallel arrays indexed per service.
   const el = document.getElementById('services');
-  if (!services.length) {
+  const n = s.id.length;
+  if (!n) {
     el.innerHTML = '<p class="empty">No services registered</p>';
     document.getElementById('subtitle').textContent = 'No services running';
     return;
   }
-  const healthy = services.filter(s => s.healthy).length;
-  document.getElementById('subtitle').textContent = `${services.length} service${services.length === 1 ? '' : 's'} registered, ${healthy} healthy`;
+  const healthy = s.healthy.filter(Boolean).length;
+  document.getElementById('subtitle').textContent = `${n} service${n === 1 ? '' : 's'} registered, ${healthy} healthy`;
   let html = '';
-  for (const s of services) {
-    const url = s.hosts[0] ? 'https://' + s.hosts[0] : '';
-    const dotClass = s.healthy ? (s.socket_exists ? 'green' : 'yellow') : 'red';
-    const status = s.healthy ? (s.socket_exists ? 'healthy' : 'no socket') : 'down';
-    const fails = s.fails > 0 ? `<span style="color:#ef4444"> ${s.fails} failed</span>` : '';
+  for (let i = 0; i < n; i++) {
+    const host = s.hosts[i][0];
+    const url = host ? 'https://' + host : '';
+    const dotClass = s.healthy[i] ? (s.socket_exists[i] ? 'green' : 'yellow') : 'red';
+    const status = s.healthy[i] ? (s.socket_exists[i] ? 'healthy' : 'no socket') : 'down';
+    const fails = s.fails[i] > 0 ? `<span style="color:#ef4444"> ${s.fails[i]} failed</span>` : '';
     html += `<div class="service">
       <div class="service-header">
-        <span class="service-name">${s.id}</span>
+        <span class="service-name">${s.id[i]}</span>
         <span class="service-health"><span class="dot ${dotClass}"></span>${status}</span>
       </div>
       <div class="service-details">
-        <span class="service-detail"><a href="${url}">${s.hosts[0] || '-'}</a></span>
-        <span class="service-detail mono">${s.socket.replace('/tmp/caddy-dev/', '')}</span>
-        <span class="service-detail">${s.requests} req${s.requests===1?'':'s'}${fails}</span>
+        <span class="service-detail"><a href="${url}">${host || '-'}</a></span>
+        <span class="service-detail mono">${s.socket[i].replace('/tmp/caddy-dev/', '')}</span>
+        <span class="service-detail">${s.requests[i]} req${s.requests[i]===1?'':'s'}${fails}</span>
       </div>
     </div>`;
   }
@@ -250,37 +562,95 @@ function renderInfra(d) {
   `;
 }
 
-refresh();
-setInterval(refresh, 5000);
 </script>
 </body>
 </html>
 """
 
+# The page is a static template — encode (and compress) it once at import
+# instead of on every request. mtime=0 keeps the gzip output deterministic.
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+DASHBOARD_HTML_GZ = gzip.compress(DASHBOARD_HTML_BYTES, compresslevel=9, mtime=0)
+
+
+def _html_response(body, gzipped):
+    """Precompose a complete HTTP response (headers + body) as one blob."""
+    hdr = ("HTTP/1.1 200 OK\r\n"
+           "Content-Type: text/html; charset=utf-8\r\n"
+           "Content-Length: %d\r\n"
+           "Cache-Control: public, max-age=300\r\n"
+           "Vary: Accept-Encoding\r\n" % len(body))
+    if gzipped:
+        hdr += "Content-Encoding: gzip\r\n"
+    return hdr.encode("ascii") + b"\r\n" + body
+
+
+# Headers never vary per request, so the HTML path is a single wfile.write
+# of a constant blob — no per-request header formatting or tiny sends.
+_HTML_RESPONSE = _html_response(DASHBOARD_HTML_BYTES, gzipped=False)
+_HTML_RESPONSE_GZ = _html_response(DASHBOARD_HTML_GZ, gzipped=True)
+
 
 class DashboardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
     def do_GET(self):
         if self.path == "/api/status":
-            data = json.dumps(get_status()).encode()
+            snap = _SNAPSHOT
+            if not snap["body"]:  # first request beat the refresh thread
+                refresh_snapshot()
+                snap = _SNAPSHOT
+            if self.headers.get("If-None-Match") == snap["etag"]:
+                self.send_response(304)
+                self.send_header("ETag", snap["etag"])
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Content-Length", str(len(snap["body"])))
+            self.send_header("ETag", snap["etag"])
+            if snap["stale"]:
+                self.send_header("X-Stale", "1")
             self.end_headers()
-            self.wfile.write(data)
-        else:
-            data = DASHBOARD_HTML.encode()
+            self.wfile.write(snap["body"])
+        elif self.path == "/api/stream":
+            self.close_connection = True  # unframed body; can't keep alive
             self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
             self.end_headers()
-            self.wfile.write(data)
+            # Push a frame only when the snapshot actually changed; steady
+            # state costs nothing on the wire.
+            last_etag = None
+            try:
+                while True:
+                    snap = _SNAPSHOT
+                    if snap["body"] and snap["etag"] != last_etag:
+                        self.wfile.write(b"data: " + snap["body"] + b"\n\n")
+                        self.wfile.flush()
+                        last_etag = snap["etag"]
+                    with _SNAPSHOT_CHANGED:
+                        changed = _SNAPSHOT_CHANGED.wait(timeout=30)
+                    if not changed:
+                        # Comment frame on idle so writes to a gone peer
+                        # fail and the thread is reaped, not leaked.
+                        self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client went away
+        else:
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+            self.wfile.write(_HTML_RESPONSE_GZ if gzipped else _HTML_RESPONSE)
 
     def log_message(self, format, *args):
         pass  # silence request logging
 
 
-class UnixHTTPServer(HTTPServer):
+class UnixHTTPServer(ThreadingMixIn, HTTPServer):
+    # Threaded so long-lived /api/stream connections don't block other
+    # clients behind them.
     address_family = socket.AF_UNIX
+    daemon_threads = True
 
     def server_bind(self):
         if os.path.exists(self.server_address):
@@ -312,6 +682,7 @@ def main():
     signal.signal(signal.SIGINT, shutdown)
 
     register_with_caddy(domain)
+    threading.Thread(target=_refresh_loop, daemon=True).start()
     print(f"dashboard: https://{ROUTE_ID}.{domain}")
     server.serve_forever()
 